@@ -7,6 +7,7 @@ It handles the CLI interface and orchestrates the project creation process.
 """
 
 import os
+import re
 import sys
 from typing import Any
 
@@ -26,6 +27,7 @@ from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Confirm, Prompt
+from rich.table import Table
 from rich.text import Text
 
 # Local imports
@@ -44,6 +46,12 @@ from create_python_project.utils import logging as log_utils
 logs_dir = os.path.join(os.path.dirname(__file__), "..", "..", "logs")
 logger = log_utils.setup_logging(logs_dir)
 
+# Fallback pattern for pulling a JSON object (up to three levels of nesting)
+# out of an AI response that is not bare JSON
+_JSON_OBJECT_RE = re.compile(
+    r"(\{(?:[^{}]|(?:\{(?:[^{}]|(?:\{[^{}]*\}))*\}))*\})", re.DOTALL
+)
+
 
 # Global CLI state management
 class CLIState:
@@ -318,8 +326,6 @@ def determine_project_type(project_info: dict[str, Any]) -> tuple[bool, str]:
         "Gemini": f"{providers.get('Gemini', 'gemini-2.5-flash-preview-05-20')}: Google's latest model optimized for data projects and integration with Google services. Strong multimodal capabilities",
     }
 
-    from rich.table import Table
-
     table = Table(
         show_header=True, header_style="bold magenta", title="🤖 Available AI Providers"
     )
@@ -414,7 +420,6 @@ def determine_project_type(project_info: dict[str, Any]) -> tuple[bool, str]:
     # Parse the comprehensive JSON response
     try:
         import json
-        import re
 
         # Handle empty or invalid responses
         if not response or response.strip() == "":
@@ -443,11 +448,7 @@ def determine_project_type(project_info: dict[str, Any]) -> tuple[bool, str]:
         except json.JSONDecodeError:
             # Try regex extraction as fallback
             logger.debug("Direct JSON parsing failed, trying regex extraction")
-            json_match = re.search(
-                r"(\{(?:[^{}]|(?:\{(?:[^{}]|(?:\{[^{}]*\}))*\}))*\})",
-                response,
-                re.DOTALL,
-            )
+            json_match = _JSON_OBJECT_RE.search(response)
 
             if json_match:
                 json_str = json_match.group(1)
@@ -522,8 +523,6 @@ def determine_project_type(project_info: dict[str, Any]) -> tuple[bool, str]:
     tech_stack = project_info.get("tech_stack", {})
 
     if tech_stack and "categories" in tech_stack:
-        from rich.table import Table
-
         # Create table showing complete technology stack
         console.print("[bold cyan]🔧 Complete Technology Stack:[/bold cyan]")
 
@@ -1303,8 +1302,6 @@ def main() -> int:
         console.print(f"  📁 [cyan]{project_info['project_dir']}[/cyan]")
 
         # Project summary panel
-        from rich.panel import Panel
-
         summary_content = f"""[bold]Project Summary:[/bold]
 • [cyan]Name:[/cyan] {project_info["project_name"]}
 • [cyan]Type:[/cyan] {project_type.capitalize()} Project
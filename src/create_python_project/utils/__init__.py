@@ -1,24 +1,29 @@
 """Utility modules for Create Python Project."""
 
-# Core modules (existing)
-# New refactored modules
-from . import (
-    ai_integration,
-    ai_prompts,
-    cli,
-    config,
-    core_project_builder,
-    development_tools,
-    extension_config,
-    ide_config,
-    logging,
-    mcp_config,
-    project_templates,
-    script_templates,
-    task_config,
-    templates,
-    workspace_config,
-)
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Core modules (existing)
+    # New refactored modules
+    from . import (
+        ai_integration,
+        ai_prompts,
+        cli,
+        config,
+        core_project_builder,
+        development_tools,
+        extension_config,
+        ide_config,
+        logging,
+        mcp_config,
+        project_templates,
+        script_templates,
+        task_config,
+        templates,
+        workspace_config,
+    )
 
 __all__ = [
     # Core modules
@@ -39,3 +44,10 @@ __all__ = [
     "script_templates",
     "workspace_config",
 ]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import submodules on first access, so the AI SDKs load only when used."""
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
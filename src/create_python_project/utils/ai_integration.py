@@ -6,7 +6,6 @@ This module handles integration with AI providers for project generation.
 It supports multiple AI providers such as OpenAI, Anthropic, Perplexity, etc.
 """
 
-import importlib.util
 import logging
 import os
 from typing import TYPE_CHECKING, Any
@@ -24,21 +23,41 @@ if TYPE_CHECKING:
 
 console = Console()
 
-# Try to import the AI provider modules
+# Try to import the AI provider modules, recording which ones are available
+_HAS_OPENAI: bool
+_HAS_ANTHROPIC: bool
+_HAS_GENAI: bool
+
 try:
     import openai  # noqa: F811
+
+    _HAS_OPENAI = True
 except ImportError:
     openai = None  # type: ignore
+    _HAS_OPENAI = False
 
 try:
     import anthropic  # noqa: F811
+
+    _HAS_ANTHROPIC = True
 except ImportError:
     anthropic = None  # type: ignore
+    _HAS_ANTHROPIC = False
 
 try:
     import google.generativeai as genai  # type: ignore # noqa: F811
+
+    _HAS_GENAI = True
 except ImportError:
     genai = None  # type: ignore
+    _HAS_GENAI = False
+
+# Shared HTTP session so repeated calls to the same REST provider reuse the
+# TCP/TLS connection instead of handshaking for every prompt
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount(
+    "https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+)
 
 
 class AIProvider:
@@ -96,13 +115,10 @@ class OpenAIProvider(AIProvider):
     def generate_response(self, prompt: str) -> tuple[bool, str]:
         """Generate a response using OpenAI API."""
         try:
-            # Check if the module is available at runtime
-            if importlib.util.find_spec("openai") is None:
+            # The optional provider package may not be installed
+            if not _HAS_OPENAI:
                 return False, "OpenAI package not installed. Run: pip install openai"
 
-            # Import openai locally
-            import openai
-
             openai.api_key = self.api_key
 
             # Use max_completion_tokens for newer models, max_tokens for older ones
@@ -165,16 +181,13 @@ class AnthropicProvider(AIProvider):
     def generate_response(self, prompt: str) -> tuple[bool, str]:
         """Generate a response using Anthropic API."""
         try:
-            # Check if the module is available at runtime
-            if importlib.util.find_spec("anthropic") is None:
+            # The optional provider package may not be installed
+            if not _HAS_ANTHROPIC:
                 return (
                     False,
                     "Anthropic package not installed. Run: pip install anthropic",
                 )
 
-            # Import anthropic locally
-            import anthropic
-
             client = anthropic.Anthropic(api_key=self.api_key)
 
             system_prompt = (
@@ -248,7 +261,7 @@ class PerplexityProvider(AIProvider):
                 "Content-Type": "application/json",
             }
 
-            payload = {
+            payload: dict[str, Any] = {
                 "model": self.model or "sonar",
                 "messages": [
                     {
@@ -265,7 +278,9 @@ class PerplexityProvider(AIProvider):
                 f"Sending request to Perplexity API with model: {payload['model']}"
             )
 
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = _HTTP_SESSION.post(
+                url, headers=headers, json=payload, timeout=30
+            )
 
             # Check for HTTP errors
             response.raise_for_status()
@@ -326,7 +341,7 @@ class DeepSeekProvider(AIProvider):
                 "Content-Type": "application/json",
             }
 
-            payload = {
+            payload: dict[str, Any] = {
                 "model": self.model or "deepseek-reasoner",
                 "messages": [
                     {
@@ -338,7 +353,7 @@ class DeepSeekProvider(AIProvider):
                 "max_tokens": 1000,
             }
 
-            response = requests.post(url, headers=headers, json=payload)
+            response = _HTTP_SESSION.post(url, headers=headers, json=payload)
             response.raise_for_status()
 
             result = response.json()
@@ -375,16 +390,13 @@ class GeminiProvider(AIProvider):
     def generate_response(self, prompt: str) -> tuple[bool, str]:
         """Generate a response using Gemini API."""
         try:
-            # Check if the module is available at runtime
-            if importlib.util.find_spec("google.generativeai") is None:
+            # The optional provider package may not be installed
+            if not _HAS_GENAI:
                 return (
                     False,
                     "Google Generative AI package not installed. Run: pip install google-generativeai",
                 )
 
-            # Import google.generativeai locally
-            import google.generativeai as genai
-
             genai.configure(api_key=self.api_key)
 
             # Set up the model
@@ -8,8 +8,15 @@ Also provides dynamic dependency management based on AI recommendations.
 """
 
 import os
+import re
 from typing import Any
 
+# Block appended to .gitignore when it does not yet ignore .env
+_GITIGNORE_ENV_ENTRY = b"\n# Environment variables\n.env\n"
+
+# Values containing whitespace that would break a bare KEY=value line
+_NEEDS_QUOTES_RE = re.compile(r"[ \n\t]")
+
 
 def load_env_file(env_file: str = ".env") -> dict[str, str]:
     """
@@ -27,27 +34,31 @@ def load_env_file(env_file: str = ".env") -> dict[str, str]:
         return env_vars
 
     try:
-        with open(env_file, encoding="utf-8") as file:
-            for line in file:
-                line = line.strip()
+        # Read the file in one go and split it in C; only assignment lines
+        # are decoded, comments and blank lines are skipped as raw bytes
+        with open(env_file, "rb") as file:
+            data = file.read()
+
+        for raw_line in data.splitlines():
+            raw_line = raw_line.strip()
 
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
+            # Skip empty lines and comments
+            if not raw_line or raw_line.startswith(b"#"):
+                continue
 
-                # Parse key-value pairs
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip()
+            # Parse key-value pairs
+            if b"=" in raw_line:
+                key, value = raw_line.decode("utf-8").split("=", 1)
+                key = key.strip()
+                value = value.strip()
 
-                    # Remove quotes if present
-                    if (value.startswith('"') and value.endswith('"')) or (
-                        value.startswith("'") and value.endswith("'")
-                    ):
-                        value = value[1:-1]
+                # Remove quotes if present
+                if (value.startswith('"') and value.endswith('"')) or (
+                    value.startswith("'") and value.endswith("'")
+                ):
+                    value = value[1:-1]
 
-                    env_vars[key] = value
+                env_vars[key] = value
 
         return env_vars
     except Exception as e:
@@ -69,41 +80,44 @@ def create_env_file(project_dir: str, variables: dict[str, str]) -> tuple[bool,
     try:
         env_file_path = os.path.join(project_dir, ".env")
 
-        with open(env_file_path, "w", encoding="utf-8") as file:
-            file.write("# Environment variables for the project\n\n")
+        # Build each file in memory and write it with a single encoded write
+        env_lines = ["# Environment variables for the project\n\n"]
+        for key, value in variables.items():
+            # Check if value needs quotes
+            if _NEEDS_QUOTES_RE.search(value):
+                value = f'"{value}"'
+            env_lines.append(f"{key}={value}\n")
 
-            for key, value in variables.items():
-                # Check if value needs quotes
-                if " " in value or "\n" in value or "\t" in value:
-                    value = f'"{value}"'
-
-                file.write(f"{key}={value}\n")
+        with open(env_file_path, "wb") as file:
+            file.write("".join(env_lines).encode("utf-8"))
 
         # Create a .env.example file without sensitive values
-        example_path = os.path.join(project_dir, ".env.example")
-        with open(example_path, "w", encoding="utf-8") as file:
-            file.write("# Example environment variables for the project\n")
-            file.write("# Copy this file to .env and fill in the values\n\n")
+        example_lines = [
+            "# Example environment variables for the project\n",
+            "# Copy this file to .env and fill in the values\n\n",
+        ]
+        example_lines.extend(f"{key}=\n" for key in variables)
 
-            for key in variables:
-                file.write(f"{key}=\n")
+        example_path = os.path.join(project_dir, ".env.example")
+        with open(example_path, "wb") as file:
+            file.write("".join(example_lines).encode("utf-8"))
 
         # Add both files to .gitignore
         gitignore_path = os.path.join(project_dir, ".gitignore")
 
         # Check if .gitignore exists and if .env is already in it
-        gitignore_content = ""
+        gitignore_content = b""
         if os.path.exists(gitignore_path):
-            with open(gitignore_path, encoding="utf-8") as file:
+            with open(gitignore_path, "rb") as file:
                 gitignore_content = file.read()
 
         # Add .env to .gitignore if not already present
         updated = False
-        if ".env" not in gitignore_content:
-            with open(gitignore_path, "a", encoding="utf-8") as file:
-                if not gitignore_content.endswith("\n"):
-                    file.write("\n")
-                file.write("\n# Environment variables\n.env\n")
+        if b".env" not in gitignore_content:
+            with open(gitignore_path, "ab") as file:
+                if not gitignore_content.endswith(b"\n"):
+                    file.write(b"\n")
+                file.write(_GITIGNORE_ENV_ENTRY)
                 updated = True
 
         return True, f"Created .env file at {env_file_path}" + (
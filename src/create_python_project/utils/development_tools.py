@@ -43,10 +43,7 @@ def setup_development_tools(
         return False, f"Failed to setup development tools: {str(e)}"
 
 
-def _create_precommit_config(project_dir: str, tech_stack: dict[str, Any]):
-    """Create .pre-commit-config.yaml with appropriate hooks."""
-
-    config_content = """default_stages: [pre-commit]
+_PRECOMMIT_CONFIG = b"""default_stages: [pre-commit]
 repos:
   # Code formatting
   - repo: https://github.com/psf/black
@@ -105,11 +102,7 @@ repos:
         stages: [commit-msg]
 """
 
-    # Add framework-specific hooks
-    backend_framework = _extract_tech_choice(tech_stack, "Backend Framework")
-
-    if backend_framework == "Django":
-        config_content += """
+_PRECOMMIT_DJANGO_HOOKS = b"""
   # Django specific hooks
   - repo: https://github.com/adamchainz/django-upgrade
     rev: 1.21.0
@@ -118,8 +111,7 @@ repos:
         args: [--target-version, "5.0"]
 """
 
-    elif backend_framework == "Flask":
-        config_content += """
+_PRECOMMIT_FLASK_HOOKS = b"""
   # Flask specific hooks
   - repo: https://github.com/Lucas-C/pre-commit-hooks-bandit
     rev: v1.0.6
@@ -128,9 +120,7 @@ repos:
         args: [-ll]
 """
 
-    # Add frontend hooks if React is used
-    if "React" in str(tech_stack):
-        config_content += """
+_PRECOMMIT_REACT_HOOKS = b"""
   # Frontend hooks (React/TypeScript)
   - repo: https://github.com/pre-commit/mirrors-eslint
     rev: v9.12.0
@@ -144,18 +134,30 @@ repos:
           - "@typescript-eslint/eslint-plugin@6.21.0"
 """
 
-    with open(os.path.join(project_dir, ".pre-commit-config.yaml"), "w") as f:
-        f.write(config_content)
 
+def _create_precommit_config(project_dir: str, tech_stack: dict[str, Any]):
+    """Create .pre-commit-config.yaml with appropriate hooks."""
 
-def _create_linting_configs(project_dir: str):
-    """Create comprehensive linting configuration files."""
+    parts = [_PRECOMMIT_CONFIG]
 
-    config_dir = os.path.join(project_dir, ".config")
-    os.makedirs(config_dir, exist_ok=True)
+    # Add framework-specific hooks
+    backend_framework = _extract_tech_choice(tech_stack, "Backend Framework")
 
-    # Enhanced mypy configuration
-    mypy_config = """[mypy]
+    if backend_framework == "Django":
+        parts.append(_PRECOMMIT_DJANGO_HOOKS)
+
+    elif backend_framework == "Flask":
+        parts.append(_PRECOMMIT_FLASK_HOOKS)
+
+    # Add frontend hooks if React is used
+    if "React" in str(tech_stack):
+        parts.append(_PRECOMMIT_REACT_HOOKS)
+
+    with open(os.path.join(project_dir, ".pre-commit-config.yaml"), "wb") as f:
+        f.write(b"".join(parts))
+
+
+_MYPY_CONFIG = b"""[mypy]
 python_version = 3.11
 warn_return_any = True
 warn_unused_configs = True
@@ -199,11 +201,7 @@ disallow_untyped_defs = false
 disallow_incomplete_defs = false
 """
 
-    with open(os.path.join(config_dir, "mypy.ini"), "w") as f:
-        f.write(mypy_config)
-
-    # Enhanced ruff configuration
-    ruff_config = """target-version = "py311"
+_RUFF_CONFIG = b"""target-version = "py311"
 line-length = 88
 indent-width = 4
 
@@ -254,11 +252,7 @@ skip-magic-trailing-comma = false
 line-ending = "auto"
 """
 
-    with open(os.path.join(config_dir, "ruff.toml"), "w") as f:
-        f.write(ruff_config)
-
-    # Create .secrets.baseline for detect-secrets
-    baseline_content = """{
+_SECRETS_BASELINE = b"""{
   "version": "1.5.0",
   "plugins_used": [
     {
@@ -371,18 +365,27 @@ line-ending = "auto"
   "generated_at": "2024-01-01T00:00:00Z"
 }"""
 
-    with open(os.path.join(project_dir, ".secrets.baseline"), "w") as f:
-        f.write(baseline_content)
 
+def _create_linting_configs(project_dir: str):
+    """Create comprehensive linting configuration files."""
 
-def _create_dev_scripts(project_dir: str):
-    """Create development utility scripts."""
+    config_dir = os.path.join(project_dir, ".config")
+    os.makedirs(config_dir, exist_ok=True)
 
-    scripts_dir = os.path.join(project_dir, "scripts")
-    os.makedirs(scripts_dir, exist_ok=True)
+    # Enhanced mypy configuration
+    with open(os.path.join(config_dir, "mypy.ini"), "wb") as f:
+        f.write(_MYPY_CONFIG)
 
-    # Quality check script
-    quality_script = """#!/usr/bin/env python3
+    # Enhanced ruff configuration
+    with open(os.path.join(config_dir, "ruff.toml"), "wb") as f:
+        f.write(_RUFF_CONFIG)
+
+    # Create .secrets.baseline for detect-secrets
+    with open(os.path.join(project_dir, ".secrets.baseline"), "wb") as f:
+        f.write(_SECRETS_BASELINE)
+
+
+_QUALITY_CHECK_SCRIPT = """#!/usr/bin/env python3
 \"\"\"Run all code quality checks.\"\"\"
 
 import subprocess
@@ -390,10 +393,10 @@ import sys
 from pathlib import Path
 
 
-def run_command(cmd: str, description: str) -> bool:
+def run_command(cmd: list[str], description: str) -> bool:
     \"\"\"Run a command and return success status.\"\"\"
     print(f"\\n🔍 {description}...")
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    result = subprocess.run(cmd, capture_output=True, text=True)
 
     if result.returncode == 0:
         print(f"✅ {description} passed")
@@ -409,12 +412,13 @@ def main():
     \"\"\"Run all quality checks.\"\"\"
     print("🚀 Running code quality checks...")
 
+    # Commands run directly rather than through a shell
     checks = [
-        ("poetry run black --check src/ tests/", "Code formatting check"),
-        ("poetry run ruff check src/ tests/", "Linting check"),
-        ("poetry run mypy --config-file=.config/mypy.ini src/", "Type checking"),
-        ("poetry run pytest --cov=src --cov-report=term-missing", "Tests with coverage"),
-        ("poetry run detect-secrets scan --baseline .secrets.baseline", "Security scan"),
+        (["poetry", "run", "black", "--check", "src/", "tests/"], "Code formatting check"),
+        (["poetry", "run", "ruff", "check", "src/", "tests/"], "Linting check"),
+        (["poetry", "run", "mypy", "--config-file=.config/mypy.ini", "src/"], "Type checking"),
+        (["poetry", "run", "pytest", "--cov=src", "--cov-report=term-missing"], "Tests with coverage"),
+        (["poetry", "run", "detect-secrets", "scan", "--baseline", ".secrets.baseline"], "Security scan"),
     ]
 
     failed_checks = []
@@ -434,14 +438,9 @@ def main():
 
 if __name__ == "__main__":
     main()
-"""
+""".encode()
 
-    with open(os.path.join(scripts_dir, "quality_check.py"), "w") as f:
-        f.write(quality_script)
-    os.chmod(os.path.join(scripts_dir, "quality_check.py"), 0o755)
-
-    # Development setup script
-    setup_script = """#!/usr/bin/env python3
+_DEV_SETUP_SCRIPT = """#!/usr/bin/env python3
 \"\"\"Set up development environment.\"\"\"
 
 import subprocess
@@ -487,10 +486,23 @@ def main():
 
 if __name__ == "__main__":
     main()
-"""
+""".encode()
+
 
-    with open(os.path.join(scripts_dir, "dev_setup.py"), "w") as f:
-        f.write(setup_script)
+def _create_dev_scripts(project_dir: str):
+    """Create development utility scripts."""
+
+    scripts_dir = os.path.join(project_dir, "scripts")
+    os.makedirs(scripts_dir, exist_ok=True)
+
+    # Quality check script
+    with open(os.path.join(scripts_dir, "quality_check.py"), "wb") as f:
+        f.write(_QUALITY_CHECK_SCRIPT)
+    os.chmod(os.path.join(scripts_dir, "quality_check.py"), 0o755)
+
+    # Development setup script
+    with open(os.path.join(scripts_dir, "dev_setup.py"), "wb") as f:
+        f.write(_DEV_SETUP_SCRIPT)
     os.chmod(os.path.join(scripts_dir, "dev_setup.py"), 0o755)
 
 
@@ -524,9 +536,7 @@ def _extract_tech_choice(tech_stack: dict[str, Any], category_name: str) -> str:
     return ""
 
 
-def create_pytest_config(project_dir: str) -> None:
-    """Create pytest configuration file."""
-    pytest_config = """[tool.pytest.ini_options]
+_PYTEST_CONFIG = b"""[tool.pytest.ini_options]
 testpaths = ["tests"]
 python_files = ["test_*.py", "*_test.py"]
 python_classes = ["Test*"]
@@ -554,16 +564,17 @@ filterwarnings = [
 ]
 """
 
+
+def create_pytest_config(project_dir: str) -> None:
+    """Create pytest configuration file."""
     # Append to pyproject.toml if it exists
     pyproject_path = os.path.join(project_dir, "pyproject.toml")
     if os.path.exists(pyproject_path):
-        with open(pyproject_path, "a") as f:
-            f.write("\n" + pytest_config)
+        with open(pyproject_path, "ab") as f:
+            f.write(b"\n" + _PYTEST_CONFIG)
 
 
-def create_coverage_config(project_dir: str) -> None:
-    """Create coverage configuration."""
-    coverage_config = """
+_COVERAGE_CONFIG = b"""
 [tool.coverage.run]
 source = ["src"]
 omit = ["*/tests/*", "*/test_*", "*/conftest.py"]
@@ -588,8 +599,11 @@ exclude_lines = [
 directory = "htmlcov"
 """
 
+
+def create_coverage_config(project_dir: str) -> None:
+    """Create coverage configuration."""
     # Append to pyproject.toml if it exists
     pyproject_path = os.path.join(project_dir, "pyproject.toml")
     if os.path.exists(pyproject_path):
-        with open(pyproject_path, "a") as f:
-            f.write(coverage_config)
+        with open(pyproject_path, "ab") as f:
+            f.write(_COVERAGE_CONFIG)
@@ -9,8 +9,62 @@ Creates appropriate settings, tasks, extensions, and MCP configurations.
 import json
 import os
 import shutil
+import string
 from typing import Any
 
+# Cursor rule files; only the project details are substituted
+_CURSOR_INSTRUCTIONS_TEMPLATE = string.Template(
+    """# $project_name - Cursor Instructions
+
+## Project Overview
+$project_kind project created with Create Python Project tool.
+
+## Technology Stack
+$tech_stack
+
+## Development Guidelines
+- Use Poetry for dependency management
+- Follow PEP 8 style guidelines with Black formatting
+- Write tests for all new functionality
+- Use type hints throughout the codebase
+- Keep functions focused and well-documented
+
+## Project Structure
+- `src/$package_name/`: Main package source code
+- `tests/`: Test files mirroring source structure
+- `docs/`: Project documentation
+- `scripts/`: Development and deployment scripts
+
+## Common Tasks
+- Install dependencies: `poetry install`
+- Run tests: `poetry run pytest`
+- Format code: `poetry run black src/`
+- Type check: `poetry run mypy src/`
+"""
+)
+
+_CURSOR_WEB_RULES = """
+## Web Development Specific
+
+### Django Guidelines
+- Use class-based views for complex logic
+- Keep models focused and normalized
+- Write custom managers for complex queries
+- Use Django's built-in authentication system
+
+### API Development
+- Return consistent JSON responses
+- Implement proper error handling
+- Use DRF serializers for validation
+- Add comprehensive API documentation
+"""
+
+
+def _write_text(path: str, content: str) -> None:
+    """Write generated text with a single write call."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
 
 class IDEConfigManager:
     """Manages IDE-specific configurations for VS Code and Cursor."""
@@ -28,6 +82,10 @@ class IDEConfigManager:
         self.tech_stack = tech_stack
         self.package_name = project_name.replace("-", "_").replace(" ", "_").lower()
 
+        # Every config file below reads the recommended technologies, so walk
+        # the tech stack once here rather than once per file
+        self._tech_choices = self._extract_tech_choices()
+
     def create_vscode_config(self) -> bool:
         """Create complete .vscode folder with all configurations."""
         vscode_dir = os.path.join(self.project_dir, ".vscode")
@@ -119,32 +177,27 @@ class IDEConfigManager:
             )
 
         settings_path = os.path.join(config_dir, "settings.json")
-        with open(settings_path, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2)
+        _write_text(settings_path, json.dumps(settings, indent=2))
 
     def _create_tasks_json(self, config_dir: str):
         """Create tasks.json with project-specific tasks."""
         from .task_config import generate_tasks_json
 
-        tasks = generate_tasks_json(self.project_type, self._extract_tech_choices())
+        tasks = generate_tasks_json(self.project_type, self._tech_choices)
 
         tasks_path = os.path.join(config_dir, "tasks.json")
-        with open(tasks_path, "w", encoding="utf-8") as f:
-            json.dump(tasks, f, indent=2)
+        _write_text(tasks_path, json.dumps(tasks, indent=2))
 
     def _create_extensions_json(self, config_dir: str):
         """Create extensions.json with recommended extensions."""
         from .extension_config import get_extensions_for_project
 
-        extensions = get_extensions_for_project(
-            self.project_type, self._extract_tech_choices()
-        )
+        extensions = get_extensions_for_project(self.project_type, self._tech_choices)
 
         extensions_config = {"recommendations": extensions}
 
         extensions_path = os.path.join(config_dir, "extensions.json")
-        with open(extensions_path, "w", encoding="utf-8") as f:
-            json.dump(extensions_config, f, indent=2)
+        _write_text(extensions_path, json.dumps(extensions_config, indent=2))
 
     def _create_launch_json(self, config_dir: str):
         """Create launch.json for debugging configurations."""
@@ -191,8 +244,7 @@ class IDEConfigManager:
         launch_config = {"version": "0.2.0", "configurations": configurations}
 
         launch_path = os.path.join(config_dir, "launch.json")
-        with open(launch_path, "w", encoding="utf-8") as f:
-            json.dump(launch_config, f, indent=2)
+        _write_text(launch_path, json.dumps(launch_config, indent=2))
 
     def _create_keybindings_json(self, config_dir: str):
         """Create keybindings.json with project-specific shortcuts."""
@@ -242,8 +294,7 @@ class IDEConfigManager:
             )
 
         keybindings_path = os.path.join(config_dir, "keybindings.json")
-        with open(keybindings_path, "w", encoding="utf-8") as f:
-            json.dump(keybindings, f, indent=2)
+        _write_text(keybindings_path, json.dumps(keybindings, indent=2))
 
     def _get_main_run_task(self) -> str:
         """Get the main run task name for this project type."""
@@ -267,89 +318,51 @@ class IDEConfigManager:
         """Create MCP configuration templates."""
         from .mcp_config import get_mcp_servers_for_project
 
-        mcp_config = get_mcp_servers_for_project(
-            self.project_type, self._extract_tech_choices()
-        )
+        mcp_config = get_mcp_servers_for_project(self.project_type, self._tech_choices)
+
+        # Both files hold the same config, so serialize it only once
+        mcp_json = json.dumps(mcp_config, indent=2)
 
         # Create mcp.json.template (without sensitive data)
-        template_path = os.path.join(config_dir, "mcp.json.template")
-        with open(template_path, "w", encoding="utf-8") as f:
-            json.dump(mcp_config, f, indent=2)
+        _write_text(os.path.join(config_dir, "mcp.json.template"), mcp_json)
 
         # Create actual mcp.json (will be gitignored)
-        mcp_path = os.path.join(config_dir, "mcp.json")
-        with open(mcp_path, "w", encoding="utf-8") as f:
-            json.dump(mcp_config, f, indent=2)
+        _write_text(os.path.join(config_dir, "mcp.json"), mcp_json)
 
     def _copy_vscode_to_cursor(self):
         """Copy VS Code configurations to Cursor directory."""
         vscode_dir = os.path.join(self.project_dir, ".vscode")
         cursor_dir = os.path.join(self.project_dir, ".cursor")
 
-        if os.path.exists(vscode_dir):
-            for file_name in os.listdir(vscode_dir):
-                if file_name.endswith(".json"):
-                    src = os.path.join(vscode_dir, file_name)
-                    dst = os.path.join(cursor_dir, file_name)
-                    shutil.copy2(src, dst)
+        # One directory scan; DirEntry carries the path and file type, so no
+        # separate exists/isfile stats are needed per entry
+        try:
+            with os.scandir(vscode_dir) as entries:
+                json_files = [
+                    entry
+                    for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return
+        for entry in json_files:
+            shutil.copy2(entry.path, os.path.join(cursor_dir, entry.name))
 
     def _create_cursor_instructions(self, rules_dir: str):
         """Create Cursor-specific instruction files."""
 
         # Main instructions file
-        instructions_content = f"""# {self.project_name} - Cursor Instructions
-
-## Project Overview
-{self.project_type.capitalize()} project created with Create Python Project tool.
-
-## Technology Stack
-{self._format_tech_stack()}
-
-## Development Guidelines
-- Use Poetry for dependency management
-- Follow PEP 8 style guidelines with Black formatting
-- Write tests for all new functionality
-- Use type hints throughout the codebase
-- Keep functions focused and well-documented
-
-## Project Structure
-- `src/{self.package_name}/`: Main package source code
-- `tests/`: Test files mirroring source structure
-- `docs/`: Project documentation
-- `scripts/`: Development and deployment scripts
-
-## Common Tasks
-- Install dependencies: `poetry install`
-- Run tests: `poetry run pytest`
-- Format code: `poetry run black src/`
-- Type check: `poetry run mypy src/`
-"""
-
-        instructions_path = os.path.join(rules_dir, "instructions.md")
-        with open(instructions_path, "w", encoding="utf-8") as f:
-            f.write(instructions_content)
+        instructions_content = _CURSOR_INSTRUCTIONS_TEMPLATE.substitute(
+            project_name=self.project_name,
+            project_kind=self.project_type.capitalize(),
+            tech_stack=self._format_tech_stack(),
+            package_name=self.package_name,
+        )
+        _write_text(os.path.join(rules_dir, "instructions.md"), instructions_content)
 
         # Project-specific rules
         if self.project_type == "web":
-            web_rules = """
-## Web Development Specific
-
-### Django Guidelines
-- Use class-based views for complex logic
-- Keep models focused and normalized
-- Write custom managers for complex queries
-- Use Django's built-in authentication system
-
-### API Development
-- Return consistent JSON responses
-- Implement proper error handling
-- Use DRF serializers for validation
-- Add comprehensive API documentation
-"""
-            with open(
-                os.path.join(rules_dir, "web_rules.md"), "w", encoding="utf-8"
-            ) as f:
-                f.write(web_rules)
+            _write_text(os.path.join(rules_dir, "web_rules.md"), _CURSOR_WEB_RULES)
 
     def _extract_tech_choices(self) -> dict[str, str]:
         """Extract technology choices from tech_stack for easier access."""
@@ -365,16 +378,14 @@ class IDEConfigManager:
 
     def _get_tech_choice(self, category_name: str) -> str:
         """Get the chosen technology for a specific category."""
-        return self._extract_tech_choices().get(category_name, "")
+        return self._tech_choices.get(category_name, "")
 
     def _format_tech_stack(self) -> str:
         """Format technology stack for documentation."""
-        choices = self._extract_tech_choices()
+        choices = self._tech_choices
         if not choices:
             return "Standard Python project configuration"
 
-        lines = []
-        for category, tech in choices.items():
-            lines.append(f"- **{category}**: {tech}")
-
-        return "\n".join(lines)
+        return "\n".join(
+            f"- **{category}**: {tech}" for category, tech in choices.items()
+        )
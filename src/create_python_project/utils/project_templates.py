@@ -6,9 +6,80 @@ Handles project-specific scaffolding and file generation based on AI recommendat
 Now fully dynamic without hardcoded technology assumptions.
 """
 
+import functools
 import os
+import re
+import shutil
+import string
 from typing import Any
 
+from .templates import get_template_path
+
+# Data-project scaffold shipped under templates/data/ as "<name>.tmpl";
+# only the notebook needs rendering (it imports from the package name)
+_DATA_SCAFFOLD_MODULES = ("data.py", "features.py", "models.py", "visualization.py")
+_DATA_SCAFFOLD_NOTEBOOK = "01_exploration.ipynb"
+
+
+# Technology-name keywords behind each structure signal. No keyword is a
+# prefix of another, so the zero-width lookahead below reports every signal
+# whose keyword occurs anywhere (even overlapping, e.g. "API" in "FastAPI")
+# in a single scan of the recommended technology names.
+_STRUCTURE_SIGNALS: dict[str, tuple[str, ...]] = {
+    "frontend": (
+        "React",
+        "Vue",
+        "Angular",
+        "Svelte",
+        "HTML",
+        "JavaScript",
+        "TypeScript",
+    ),
+    "backend": ("Django", "Flask", "FastAPI", "Express", "Node.js"),
+    "gui": ("PyQt", "Tkinter", "Kivy", "Electron"),
+    "cli": ("Click", "Typer", "ArgParse", "Command Line"),
+    "data": ("Pandas", "NumPy", "Jupyter", "Matplotlib", "Plotly", "Scikit-learn"),
+    "mobile": ("Mobile", "API", "REST", "GraphQL"),
+}
+_STRUCTURE_SIGNALS_RE = re.compile(
+    "(?=(?:"
+    + "|".join(
+        f"(?P<{signal}>{'|'.join(map(re.escape, keywords))})"
+        for signal, keywords in _STRUCTURE_SIGNALS.items()
+    )
+    + "))"
+)
+
+
+# Structure chosen from the detected signals, first match wins: the signals
+# that must all be present, the signals that must all be absent, and the
+# resulting structure. Full-stack and framework-only stacks are resolved
+# through _BACKEND_WEB_STRUCTURES afterwards.
+_STRUCTURE_RULES: tuple[tuple[frozenset[str], frozenset[str], str], ...] = (
+    (frozenset({"gui"}), frozenset({"frontend"}), "gui_desktop"),
+    (frozenset({"cli"}), frozenset({"frontend", "backend"}), "cli_application"),
+    (frozenset({"data"}), frozenset({"frontend"}), "data_processing"),
+    (frozenset({"backend", "mobile"}), frozenset({"frontend"}), "mobile_backend"),
+    (frozenset({"backend"}), frozenset({"frontend"}), "api_backend"),
+)
+_BACKEND_WEB_STRUCTURES = {
+    "Django": "django_web",
+    "Flask": "flask_web",
+    "FastAPI": "fastapi_web",
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _render_data_notebook(package_name: str) -> bytes:
+    """Render the packaged exploration notebook for a package name."""
+    with open(
+        get_template_path(f"data/{_DATA_SCAFFOLD_NOTEBOOK}.tmpl"), encoding="utf-8"
+    ) as template:
+        notebook = string.Template(template.read()).substitute(
+            package_name=package_name
+        )
+    return notebook.encode("utf-8")
+
 
 class ProjectTemplateManager:
     """Manages project-specific templates and scaffolding based on AI recommendations."""
@@ -19,6 +90,17 @@ class ProjectTemplateManager:
         self.tech_stack = tech_stack
         self.package_name = project_name.replace("-", "_").replace(" ", "_").lower()
 
+        # Package source directory shared by every structure type
+        self.src_dir = os.path.join(project_dir, "src", self.package_name)
+
+        # Directories already created by _create_file, so repeated files in
+        # the same directory skip the makedirs/stat round trip
+        self._created_dirs: set[str] = set()
+
+        # Index each category's recommended technology once; every
+        # _extract_tech lookup below and in the builders reads this map
+        self._tech_choices = self._index_tech_choices()
+
         # Extract key technologies from AI recommendations
         self.backend_framework = self._extract_tech("Backend Framework")
         self.database = self._extract_tech("Database")
@@ -28,14 +110,12 @@ class ProjectTemplateManager:
 
         # Extract AI analysis insights
         self.ai_analysis = tech_stack.get("analysis", [])
-        self.needs_geo = any("geo" in item.lower() for item in self.ai_analysis)
-        self.needs_realtime = any(
-            "real-time" in item.lower() for item in self.ai_analysis
-        )
-        self.needs_auth = any(
-            "auth" in item.lower() or "oauth" in item.lower()
-            for item in self.ai_analysis
-        )
+        # Lowercase the insights once and test each keyword against the
+        # joined text (no keyword spans a newline); "auth" also covers "oauth"
+        analysis_text = "\n".join(item.lower() for item in self.ai_analysis)
+        self.needs_geo = "geo" in analysis_text
+        self.needs_realtime = "real-time" in analysis_text
+        self.needs_auth = "auth" in analysis_text
 
     def create_project_structure(self, project_type: str) -> bool:
         """Create complete project structure based on AI comprehensive analysis."""
@@ -82,135 +162,70 @@ class ProjectTemplateManager:
             return "basic"
 
         # Extract all recommended technologies
-        recommended_techs = []
-        for category in self.tech_stack["categories"]:
-            for option in category.get("options", []):
-                if option.get("recommended", False):
-                    recommended_techs.append(
-                        {"name": option["name"], "category": category["name"]}
-                    )
-
-        # Technology combination analysis
-        has_frontend = any(
-            any(
-                frontend in tech["name"]
-                for frontend in [
-                    "React",
-                    "Vue",
-                    "Angular",
-                    "Svelte",
-                    "HTML",
-                    "JavaScript",
-                    "TypeScript",
-                ]
-            )
-            for tech in recommended_techs
-        )
-
-        has_backend = any(
-            any(
-                backend in tech["name"]
-                for backend in ["Django", "Flask", "FastAPI", "Express", "Node.js"]
-            )
-            for tech in recommended_techs
-        )
-
-        has_gui_framework = any(
-            any(gui in tech["name"] for gui in ["PyQt", "Tkinter", "Kivy", "Electron"])
-            for tech in recommended_techs
-        )
+        recommended_techs = [
+            (option["name"], category["name"])
+            for category in self.tech_stack["categories"]
+            for option in category.get("options", [])
+            if option.get("recommended", False)
+        ]
 
-        has_cli_tools = any(
-            any(
-                cli in tech["name"]
-                for cli in ["Click", "Typer", "ArgParse", "Command Line"]
-            )
-            for tech in recommended_techs
-        )
+        if not recommended_techs:
+            return "basic"
 
-        has_data_tools = any(
-            any(
-                data in tech["name"]
-                for data in [
-                    "Pandas",
-                    "NumPy",
-                    "Jupyter",
-                    "Matplotlib",
-                    "Plotly",
-                    "Scikit-learn",
-                ]
-            )
-            for tech in recommended_techs
-        )
+        # Decision logic based on technology combinations; Electron wins
+        # outright, so check it before scanning the names for signals
+        if any(
+            "Electron" in name or "Electron" in category
+            for name, category in recommended_techs
+        ):
+            return "electron_desktop"
 
-        has_mobile_indicators = any(
-            any(
-                mobile in tech["name"]
-                for mobile in ["Mobile", "API", "REST", "GraphQL"]
-            )
-            for tech in recommended_techs
-        )
+        # Technology combination analysis in one pass over the names
+        names = "\n".join(name for name, _ in recommended_techs)
+        signals = {match.lastgroup for match in _STRUCTURE_SIGNALS_RE.finditer(names)}
+        for required, excluded, structure in _STRUCTURE_RULES:
+            if required <= signals and signals.isdisjoint(excluded):
+                return structure
 
-        # Specific backend framework detection
+        # Specific backend framework detection, only needed for web stacks
         backend_framework = self._extract_tech(
             "Backend Framework"
         ) or self._extract_tech("Backend")
 
-        # Decision logic based on technology combinations
-        if "Electron" in str(recommended_techs):
-            return "electron_desktop"
-        elif has_gui_framework and not has_frontend:
-            return "gui_desktop"
-        elif has_cli_tools and not has_frontend and not has_backend:
-            return "cli_application"
-        elif has_data_tools and not has_frontend:
-            return "data_processing"
-        elif has_frontend and has_backend:
-            # Full-stack web application
-            framework_map = {
-                "Django": "django_web",
-                "Flask": "flask_web",
-                "FastAPI": "fastapi_web",
-            }
-            return framework_map.get(backend_framework, "web_fullstack")
-        elif has_backend and not has_frontend:
-            # API-only backend
-            if has_mobile_indicators:
-                return "mobile_backend"
-            else:
-                return "api_backend"
-        elif backend_framework == "Django":
-            return "django_web"
-        elif backend_framework == "Flask":
-            return "flask_web"
-        elif backend_framework == "FastAPI":
-            return "fastapi_web"
-        else:
-            return "basic"
+        # Full-stack web application
+        if {"frontend", "backend"} <= signals:
+            return _BACKEND_WEB_STRUCTURES.get(backend_framework, "web_fullstack")
+        return _BACKEND_WEB_STRUCTURES.get(backend_framework, "basic")
 
-    def _extract_tech(self, category_name: str) -> str:
-        """Extract recommended technology for a category."""
+    def _index_tech_choices(self) -> dict[str, str]:
+        """Map each category name to its first recommended technology."""
+        index: dict[str, str] = {}
         if isinstance(self.tech_stack, dict) and "categories" in self.tech_stack:
             for category in self.tech_stack["categories"]:
-                if category.get("name") == category_name:
-                    for option in category.get("options", []):
-                        if option.get("recommended", False):
-                            return str(option["name"])
-        return ""
+                name = category.get("name")
+                if name in index:
+                    continue
+                for option in category.get("options", []):
+                    if option.get("recommended", False):
+                        index[name] = str(option["name"])
+                        break
+        return index
+
+    def _extract_tech(self, category_name: str) -> str:
+        """Extract recommended technology for a category."""
+        return self._tech_choices.get(category_name, "")
 
     def _create_django_project(self) -> bool:
         """Create Django project structure based on AI recommendations."""
         # Backend directory
         backend_dir = os.path.join(self.project_dir, "backend")
-        os.makedirs(backend_dir, exist_ok=True)
 
         # Create Django project structure
         django_project_dir = os.path.join(backend_dir, self.package_name)
-        os.makedirs(django_project_dir, exist_ok=True)
 
         # Settings package
         settings_dir = os.path.join(django_project_dir, "settings")
-        os.makedirs(settings_dir, exist_ok=True)
+        self._make_dirs(settings_dir)
 
         # Create Django configuration files
         self._create_file(backend_dir, "manage.py", self._get_django_manage_py())
@@ -234,7 +249,7 @@ class ProjectTemplateManager:
 
         # Create apps based on AI analysis
         apps_dir = os.path.join(backend_dir, "apps")
-        os.makedirs(apps_dir, exist_ok=True)
+        self._make_dirs(apps_dir)
 
         # Always create core app
         self._create_django_app(apps_dir, "core", "Core functionality")
@@ -265,11 +280,10 @@ class ProjectTemplateManager:
         """Create Flask project structure based on AI recommendations."""
         # Backend directory for consistency
         backend_dir = os.path.join(self.project_dir, "backend")
-        os.makedirs(backend_dir, exist_ok=True)
 
         # Flask application structure
         app_dir = os.path.join(backend_dir, self.package_name)
-        os.makedirs(app_dir, exist_ok=True)
+        self._make_dirs(app_dir)
 
         # Create Flask app files
         self._create_file(backend_dir, "app.py", self._get_flask_app())
@@ -282,28 +296,29 @@ class ProjectTemplateManager:
 
         # Create blueprints based on needs
         blueprints_dir = os.path.join(app_dir, "blueprints")
-        os.makedirs(blueprints_dir, exist_ok=True)
+        self._make_dirs(blueprints_dir)
         self._create_file(blueprints_dir, "__init__.py", "")
 
         if self.needs_auth:
             auth_dir = os.path.join(blueprints_dir, "auth")
-            os.makedirs(auth_dir, exist_ok=True)
+            self._make_dirs(auth_dir)
             self._create_flask_blueprint(auth_dir, "auth", "Authentication")
 
         # Create models if database is specified
         if self.database:
             models_dir = os.path.join(app_dir, "models")
-            os.makedirs(models_dir, exist_ok=True)
+            self._make_dirs(models_dir)
             self._create_file(models_dir, "__init__.py", "")
             self._create_file(models_dir, "base.py", self._get_flask_models_base())
 
         # Create templates and static directories
         templates_dir = os.path.join(backend_dir, "templates")
         static_dir = os.path.join(backend_dir, "static")
-        os.makedirs(templates_dir, exist_ok=True)
-        os.makedirs(static_dir, exist_ok=True)
-        os.makedirs(os.path.join(static_dir, "css"), exist_ok=True)
-        os.makedirs(os.path.join(static_dir, "js"), exist_ok=True)
+        self._make_dirs(
+            templates_dir,
+            os.path.join(static_dir, "css"),
+            os.path.join(static_dir, "js"),
+        )
 
         # Create frontend if specified
         if self.frontend_framework and "React" in self.frontend_framework:
@@ -314,7 +329,7 @@ class ProjectTemplateManager:
     def _create_fastapi_project(self) -> bool:
         """Create FastAPI project structure."""
         # API structure in src
-        api_dir = os.path.join(self.project_dir, "src", self.package_name)
+        api_dir = self.src_dir
 
         # Create FastAPI app structure
         self._create_file(api_dir, "main.py", self._get_fastapi_main())
@@ -322,12 +337,12 @@ class ProjectTemplateManager:
 
         # Create API directories
         for subdir in ["api", "core", "models", "schemas", "services"]:
-            os.makedirs(os.path.join(api_dir, subdir), exist_ok=True)
+            self._make_dirs(os.path.join(api_dir, subdir))
             self._create_file(os.path.join(api_dir, subdir), "__init__.py", "")
 
         # Create routers
         routers_dir = os.path.join(api_dir, "api", "v1")
-        os.makedirs(routers_dir, exist_ok=True)
+        self._make_dirs(routers_dir)
         self._create_file(routers_dir, "__init__.py", "")
 
         if self.needs_auth:
@@ -345,30 +360,47 @@ class ProjectTemplateManager:
 
     def _create_data_project(self) -> bool:
         """Create data science project structure."""
-        # Data directories
-        for dir_name in ["data/raw", "data/processed", "notebooks", "reports/figures"]:
-            os.makedirs(os.path.join(self.project_dir, dir_name), exist_ok=True)
+        self._create_data_scaffold()
+
+        return True
 
-        # Source code structure
-        src_dir = os.path.join(self.project_dir, "src", self.package_name)
+    def _create_data_scaffold(self) -> None:
+        """Copy the packaged data-science modules and exploration notebook."""
+        src_dir = self.src_dir
+
+        # Create every directory up front, so the writes below never go back
+        # to the filesystem for a makedirs
+        self._make_dirs(
+            *(
+                os.path.join(self.project_dir, dir_name)
+                for dir_name in [
+                    "data/raw",
+                    "data/processed",
+                    "notebooks",
+                    "reports/figures",
+                ]
+            ),
+            src_dir,
+        )
 
-        # Data science modules
-        self._create_file(src_dir, "data.py", self._get_data_module())
-        self._create_file(src_dir, "features.py", self._get_features_module())
-        self._create_file(src_dir, "models.py", self._get_ml_models_module())
-        self._create_file(src_dir, "visualization.py", self._get_visualization_module())
+        # Static modules need no rendering, so copy them byte for byte
+        for module in _DATA_SCAFFOLD_MODULES:
+            shutil.copyfile(
+                get_template_path(f"data/{module}.tmpl"),
+                os.path.join(src_dir, module),
+            )
 
-        # Create sample notebook
+        # The notebook size is known up front, so write it unbuffered in a
+        # single call rather than staging it through a text wrapper
         notebook_path = os.path.join(
-            self.project_dir, "notebooks", "01_exploration.ipynb"
+            self.project_dir, "notebooks", _DATA_SCAFFOLD_NOTEBOOK
         )
-        self._create_file("", notebook_path, self._get_sample_notebook())
-
-        return True
+        with open(notebook_path, "wb", buffering=0) as notebook:
+            notebook.write(_render_data_notebook(self.package_name))
 
     def _create_cli_project(self) -> bool:
         """Create CLI project structure."""
-        src_dir = os.path.join(self.project_dir, "src", self.package_name)
+        src_dir = self.src_dir
 
         # CLI modules
         self._create_file(src_dir, "__main__.py", self._get_cli_main())
@@ -400,7 +432,7 @@ class ProjectTemplateManager:
 
     def _create_pyqt_project(self) -> bool:
         """Create a PyQt desktop application."""
-        src_dir = os.path.join(self.project_dir, "src", self.package_name)
+        src_dir = self.src_dir
 
         # Create main application file
         main_content = f'''"""Main PyQt application for {self.project_name}."""
@@ -481,22 +513,22 @@ def show_warning_dialog(parent: Optional[QWidget], title: str, message: str):
 
         # Create widgets module for custom widgets
         widgets_dir = os.path.join(src_dir, "widgets")
-        os.makedirs(widgets_dir, exist_ok=True)
+        self._make_dirs(widgets_dir)
         self._create_file(
             widgets_dir, "__init__.py", '"""Custom widgets for the application."""'
         )
 
         # Create resources directory for assets
         resources_dir = os.path.join(self.project_dir, "resources")
-        os.makedirs(resources_dir, exist_ok=True)
-        os.makedirs(os.path.join(resources_dir, "icons"), exist_ok=True)
-        os.makedirs(os.path.join(resources_dir, "images"), exist_ok=True)
+        self._make_dirs(
+            os.path.join(resources_dir, "icons"), os.path.join(resources_dir, "images")
+        )
 
         return True
 
     def _create_tkinter_project(self) -> bool:
         """Create a Tkinter desktop application."""
-        src_dir = os.path.join(self.project_dir, "src", self.package_name)
+        src_dir = self.src_dir
 
         main_content = f'''"""Main Tkinter application for {self.project_name}."""
 
@@ -582,7 +614,7 @@ def show_warning_dialog(title: str, message: str):
 
     def _create_kivy_project(self) -> bool:
         """Create a Kivy desktop application."""
-        src_dir = os.path.join(self.project_dir, "src", self.package_name)
+        src_dir = self.src_dir
 
         main_content = f'''"""Main Kivy application for {self.project_name}."""
 
@@ -668,7 +700,7 @@ def show_popup(title: str, message: str, size_hint=(0.6, 0.4)):
 
     def _create_basic_project(self) -> bool:
         """Create basic Python package structure."""
-        src_dir = os.path.join(self.project_dir, "src", self.package_name)
+        src_dir = self.src_dir
 
         # Basic module
         self._create_file(src_dir, "main.py", self._get_basic_main())
@@ -808,7 +840,7 @@ app.on('activate', () => {{
     def _create_django_app(self, apps_dir: str, app_name: str, description: str):
         """Create a Django app with full structure."""
         app_dir = os.path.join(apps_dir, app_name)
-        os.makedirs(app_dir, exist_ok=True)
+        self._make_dirs(app_dir)
 
         # Standard Django app files
         files = {
@@ -836,7 +868,7 @@ app.on('activate', () => {{
             "templates/" + app_name,
             "static/" + app_name,
         ]:
-            os.makedirs(os.path.join(app_dir, subdir), exist_ok=True)
+            self._make_dirs(os.path.join(app_dir, subdir))
             if "migrations" in subdir or "tests" in subdir:
                 self._create_file(os.path.join(app_dir, subdir), "__init__.py", "")
 
@@ -854,7 +886,7 @@ app.on('activate', () => {{
     def _create_react_frontend(self):
         """Create React frontend structure with TypeScript if specified."""
         frontend_dir = os.path.join(self.project_dir, "frontend")
-        os.makedirs(frontend_dir, exist_ok=True)
+        self._make_dirs(frontend_dir)
 
         # Determine if TypeScript is being used
         uses_typescript = "TypeScript" in self.frontend_framework
@@ -866,11 +898,14 @@ app.on('activate', () => {{
 
         # Create source structure
         src_dir = os.path.join(frontend_dir, "src")
-        os.makedirs(src_dir, exist_ok=True)
 
         # Create component directories
-        for subdir in ["components", "pages", "services", "utils", "styles"]:
-            os.makedirs(os.path.join(src_dir, subdir), exist_ok=True)
+        self._make_dirs(
+            *(
+                os.path.join(src_dir, subdir)
+                for subdir in ["components", "pages", "services", "utils", "styles"]
+            )
+        )
 
         # Create main app files
         ext = "tsx" if uses_typescript else "jsx"
@@ -897,12 +932,12 @@ app.on('activate', () => {{
 
         # Public directory
         public_dir = os.path.join(frontend_dir, "public")
-        os.makedirs(public_dir, exist_ok=True)
+        self._make_dirs(public_dir)
 
     def _create_htmx_templates(self, backend_dir: str):
         """Create HTMX-based templates for server-side rendering."""
         templates_dir = os.path.join(backend_dir, "templates")
-        os.makedirs(templates_dir, exist_ok=True)
+        self._make_dirs(templates_dir)
 
         # Base template
         self._create_file(templates_dir, "base.html", self._get_htmx_base_template())
@@ -910,12 +945,22 @@ app.on('activate', () => {{
         # Index template
         self._create_file(templates_dir, "index.html", self._get_htmx_index_template())
 
+    def _make_dirs(self, *directories: str) -> None:
+        """Create directories in one pass, skipping any already created."""
+        for directory in directories:
+            if directory in self._created_dirs:
+                continue
+            os.makedirs(directory, exist_ok=True)
+            while directory and directory not in self._created_dirs:
+                self._created_dirs.add(directory)
+                directory = os.path.dirname(directory)
+
     def _create_file(self, directory: str, filename: str, content: str):
         """Create a file with the given content."""
         filepath = os.path.join(directory, filename) if directory else filename
 
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        # Create directory if it hasn't been created yet
+        self._make_dirs(os.path.dirname(filepath))
 
         with open(filepath, "w", encoding="utf-8") as file:
             file.write(content)
@@ -1535,281 +1580,6 @@ async def login(
     return {"access_token": access_token, "token_type": "bearer"}
 '''
 
-    def _get_data_module(self) -> str:
-        return '''"""Data loading and processing module."""
-
-import pandas as pd
-from pathlib import Path
-from typing import Union, Optional
-
-
-def load_data(
-    filepath: Union[str, Path],
-    **kwargs
-) -> pd.DataFrame:
-    """Load data from various file formats."""
-    filepath = Path(filepath)
-
-    if filepath.suffix == '.csv':
-        return pd.read_csv(filepath, **kwargs)
-    elif filepath.suffix in ['.xlsx', '.xls']:
-        return pd.read_excel(filepath, **kwargs)
-    elif filepath.suffix == '.json':
-        return pd.read_json(filepath, **kwargs)
-    elif filepath.suffix == '.parquet':
-        return pd.read_parquet(filepath, **kwargs)
-    else:
-        raise ValueError(f"Unsupported file format: {filepath.suffix}")
-
-
-def save_data(
-    df: pd.DataFrame,
-    filepath: Union[str, Path],
-    **kwargs
-) -> None:
-    """Save DataFrame to file."""
-    filepath = Path(filepath)
-
-    if filepath.suffix == '.csv':
-        df.to_csv(filepath, index=False, **kwargs)
-    elif filepath.suffix in ['.xlsx', '.xls']:
-        df.to_excel(filepath, index=False, **kwargs)
-    elif filepath.suffix == '.json':
-        df.to_json(filepath, **kwargs)
-    elif filepath.suffix == '.parquet':
-        df.to_parquet(filepath, **kwargs)
-    else:
-        raise ValueError(f"Unsupported file format: {filepath.suffix}")
-'''
-
-    def _get_features_module(self) -> str:
-        return '''"""Feature engineering module."""
-
-import pandas as pd
-import numpy as np
-from typing import List, Optional
-
-
-def create_features(df: pd.DataFrame) -> pd.DataFrame:
-    """Create features from raw data."""
-    # Add your feature engineering logic here
-    return df
-
-
-def select_features(
-    df: pd.DataFrame,
-    target_col: str,
-    n_features: int = 10
-) -> List[str]:
-    """Select top features based on correlation with target."""
-    # Calculate correlations
-    correlations = df.corr()[target_col].abs()
-
-    # Remove target from features
-    correlations = correlations.drop(target_col)
-
-    # Select top n features
-    top_features = correlations.nlargest(n_features).index.tolist()
-
-    return top_features
-'''
-
-    def _get_ml_models_module(self) -> str:
-        return '''"""Machine learning models module."""
-
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, mean_squared_error
-import joblib
-from pathlib import Path
-from typing import Any, Tuple, Union
-
-
-def train_model(
-    X, y,
-    model: Any,
-    test_size: float = 0.2,
-    random_state: int = 42
-) -> Tuple[Any, dict]:
-    """Train a machine learning model."""
-    # Split data
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=test_size, random_state=random_state
-    )
-
-    # Train model
-    model.fit(X_train, y_train)
-
-    # Make predictions
-    y_pred = model.predict(X_test)
-
-    # Calculate metrics
-    metrics = {
-        "train_score": model.score(X_train, y_train),
-        "test_score": model.score(X_test, y_test),
-    }
-
-    return model, metrics
-
-
-def save_model(model: Any, filepath: Union[str, Path]) -> None:
-    """Save trained model to disk."""
-    filepath = Path(filepath)
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-    joblib.dump(model, filepath)
-
-
-def load_model(filepath: Union[str, Path]) -> Any:
-    """Load model from disk."""
-    return joblib.load(filepath)
-'''
-
-    def _get_visualization_module(self) -> str:
-        return '''"""Data visualization module."""
-
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
-import numpy as np
-from typing import Optional, Tuple
-
-
-def setup_plot_style():
-    """Set up matplotlib style."""
-    plt.style.use('seaborn-v0_8-darkgrid')
-    sns.set_palette("husl")
-
-
-def plot_distribution(
-    data: pd.Series,
-    title: Optional[str] = None,
-    figsize: Tuple[int, int] = (10, 6)
-) -> None:
-    """Plot distribution of a variable."""
-    setup_plot_style()
-
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize)
-
-    # Histogram
-    data.hist(ax=ax1, bins=30, edgecolor='black')
-    ax1.set_title('Histogram')
-    ax1.set_xlabel(data.name)
-    ax1.set_ylabel('Frequency')
-
-    # Box plot
-    data.plot(kind='box', ax=ax2)
-    ax2.set_title('Box Plot')
-
-    if title:
-        fig.suptitle(title, fontsize=16)
-
-    plt.tight_layout()
-    plt.show()
-
-
-def plot_correlation_matrix(
-    df: pd.DataFrame,
-    figsize: Tuple[int, int] = (12, 10)
-) -> None:
-    """Plot correlation matrix heatmap."""
-    setup_plot_style()
-
-    plt.figure(figsize=figsize)
-
-    # Calculate correlation matrix
-    corr = df.select_dtypes(include=[np.number]).corr()
-
-    # Create heatmap
-    sns.heatmap(
-        corr,
-        annot=True,
-        fmt='.2f',
-        cmap='coolwarm',
-        center=0,
-        square=True,
-        linewidths=0.5
-    )
-
-    plt.title('Correlation Matrix', fontsize=16)
-    plt.tight_layout()
-    plt.show()
-'''
-
-    def _get_sample_notebook(self) -> str:
-        return (
-            """{
- "cells": [
-  {
-   "cell_type": "markdown",
-   "metadata": {},
-   "source": [
-    "# Data Exploration Notebook\\n",
-    "\\n",
-    "This notebook provides a starting point for data exploration and analysis."
-   ]
-  },
-  {
-   "cell_type": "code",
-   "execution_count": null,
-   "metadata": {},
-   "outputs": [],
-   "source": [
-    "# Import libraries\\n",
-    "import pandas as pd\\n",
-    "import numpy as np\\n",
-    "import matplotlib.pyplot as plt\\n",
-    "import seaborn as sns\\n",
-    "\\n",
-    "# Import project modules\\n",
-    "import sys\\n",
-    "sys.path.append('../src')\\n",
-    "\\n",
-    "from """
-            + self.package_name
-            + """.data import load_data\\n",
-    "from """
-            + self.package_name
-            + """.visualization import setup_plot_style, plot_distribution\\n",
-    "\\n",
-    "# Set up plotting\\n",
-    "setup_plot_style()\\n",
-    "%matplotlib inline"
-   ]
-  },
-  {
-   "cell_type": "markdown",
-   "metadata": {},
-   "source": [
-    "## Load Data"
-   ]
-  },
-  {
-   "cell_type": "code",
-   "execution_count": null,
-   "metadata": {},
-   "outputs": [],
-   "source": [
-    "# Load your data here\\n",
-    "# df = load_data('../data/raw/your_data.csv')\\n",
-    "# df.head()"
-   ]
-  }
- ],
- "metadata": {
-  "kernelspec": {
-   "display_name": "Python 3",
-   "language": "python",
-   "name": "python3"
-  },
-  "language_info": {
-   "name": "python",
-   "version": "3.11.0"
-  }
- },
- "nbformat": 4,
- "nbformat_minor": 4
-}"""
-        )
-
     def _get_cli_main(self) -> str:
         return '''"""Main entry point for CLI application."""
 
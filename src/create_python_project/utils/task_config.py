@@ -464,6 +464,9 @@ def _get_tech_stack_tasks(tech_stack: dict[str, str]) -> list[dict[str, Any]]:
     """Get tasks specific to the technology stack."""
     tasks = []
 
+    # Render the stack once for the keyword checks below
+    stack_text = str(tech_stack)
+
     # Database tasks
     database = tech_stack.get("Database", "")
     if database == "PostgreSQL":
@@ -508,7 +511,7 @@ def _get_tech_stack_tasks(tech_stack: dict[str, str]) -> list[dict[str, Any]]:
         )
 
     # Celery/Redis tasks
-    if "Celery" in str(tech_stack) or "Redis" in str(tech_stack):
+    if "Celery" in stack_text or "Redis" in stack_text:
         tasks.extend(
             [
                 {
@@ -547,7 +550,7 @@ def _get_tech_stack_tasks(tech_stack: dict[str, str]) -> list[dict[str, Any]]:
         )
 
     # Docker tasks
-    if "Docker" in str(tech_stack):
+    if "Docker" in stack_text:
         tasks.extend(
             [
                 {
@@ -15,19 +15,25 @@ def create_workspace_file(
 ) -> tuple[bool, str]:
     """Create a comprehensive VS Code workspace file."""
     try:
+        choices = _tech_choice_index(tech_stack)
+        # Render the stack once for the keyword checks in the helpers below
+        stack_text = str(tech_stack)
         workspace_config = {
-            "folders": _get_workspace_folders(project_dir, project_name, tech_stack),
-            "settings": _get_workspace_settings(project_type, tech_stack),
-            "extensions": _get_workspace_extensions(project_type, tech_stack),
+            "folders": _get_workspace_folders(
+                project_dir, project_name, stack_text, choices
+            ),
+            "settings": _get_workspace_settings(project_type, choices),
+            "extensions": _get_workspace_extensions(project_type, stack_text, choices),
             "tasks": _get_workspace_tasks(project_type, tech_stack),
             "launch": _get_workspace_launch_configs(
-                project_name, project_type, tech_stack
+                project_name, project_type, choices
             ),
         }
 
         workspace_file = os.path.join(project_dir, f"{project_name}.code-workspace")
+        # Serialize first so the file gets one write instead of one per token
         with open(workspace_file, "w", encoding="utf-8") as f:
-            json.dump(workspace_config, f, indent=2)
+            f.write(json.dumps(workspace_config, indent=2))
 
         return True, f"Workspace file created: {workspace_file}"
     except Exception as e:
@@ -35,7 +41,10 @@ def create_workspace_file(
 
 
 def _get_workspace_folders(
-    project_dir: str, project_name: str, tech_stack: dict[str, Any]
+    project_dir: str,
+    project_name: str,
+    stack_text: str,
+    choices: dict[str, str],
 ) -> list[dict[str, str]]:
     """Get workspace folder configuration."""
     folders = [
@@ -43,8 +52,8 @@ def _get_workspace_folders(
     ]
 
     # Add backend/frontend folders for web projects
-    backend_framework = _extract_tech_choice(tech_stack, "Backend Framework")
-    frontend_framework = _extract_tech_choice(tech_stack, "Frontend")
+    backend_framework = choices.get("Backend Framework", "")
+    frontend_framework = choices.get("Frontend", "")
 
     if backend_framework in ["Django", "Flask"]:
         folders.append({"name": "Backend", "path": "./backend"})
@@ -62,7 +71,7 @@ def _get_workspace_folders(
     )
 
     # Add data science specific folders
-    if "data" in str(tech_stack).lower():
+    if "data" in stack_text.lower():
         folders.extend(
             [
                 {"name": "Data", "path": "./data"},
@@ -74,7 +83,7 @@ def _get_workspace_folders(
 
 
 def _get_workspace_settings(
-    project_type: str, tech_stack: dict[str, Any]
+    project_type: str, choices: dict[str, str]
 ) -> dict[str, Any]:
     """Get workspace-specific settings."""
     settings = {
@@ -127,7 +136,7 @@ def _get_workspace_settings(
 
     # Add project-type specific settings
     if project_type == "web":
-        backend = _extract_tech_choice(tech_stack, "Backend Framework")
+        backend = choices.get("Backend Framework", "")
         if backend == "Django":
             settings.update(
                 {
@@ -138,7 +147,7 @@ def _get_workspace_settings(
                 }
             )
 
-        frontend = _extract_tech_choice(tech_stack, "Frontend")
+        frontend = choices.get("Frontend", "")
         if frontend and "React" in frontend:
             settings.update(
                 {
@@ -165,7 +174,7 @@ def _get_workspace_settings(
 
 
 def _get_workspace_extensions(
-    project_type: str, tech_stack: dict[str, Any]
+    project_type: str, stack_text: str, choices: dict[str, str]
 ) -> dict[str, list[str]]:
     """Get recommended extensions for the workspace."""
     base_extensions = [
@@ -190,13 +199,13 @@ def _get_workspace_extensions(
 
     # Add project-type specific extensions
     if project_type == "web":
-        backend = _extract_tech_choice(tech_stack, "Backend Framework")
+        backend = choices.get("Backend Framework", "")
         if backend == "Django":
             base_extensions.extend(["batisteo.vscode-django", "wholroyd.jinja"])
         elif backend == "Flask":
             base_extensions.extend(["wholroyd.jinja", "alexcvzz.vscode-flask-snippets"])
 
-        frontend = _extract_tech_choice(tech_stack, "Frontend")
+        frontend = choices.get("Frontend", "")
         if frontend and "React" in frontend:
             base_extensions.extend(
                 [
@@ -231,14 +240,14 @@ def _get_workspace_extensions(
         )
 
     # Add database-specific extensions
-    database = _extract_tech_choice(tech_stack, "Database")
+    database = choices.get("Database", "")
     if database == "PostgreSQL":
         base_extensions.append("ckolkman.vscode-postgres")
     elif database == "MongoDB":
         base_extensions.append("mongodb.mongodb-vscode")
 
     # Add Docker extension if needed
-    if "Docker" in str(tech_stack):
+    if "Docker" in stack_text:
         base_extensions.append("ms-azuretools.vscode-docker")
 
     return {"recommendations": base_extensions}
@@ -252,7 +261,7 @@ def _get_workspace_tasks(
 
 
 def _get_workspace_launch_configs(
-    project_name: str, project_type: str, tech_stack: dict[str, Any]
+    project_name: str, project_type: str, choices: dict[str, str]
 ) -> dict[str, Any]:
     """Get debug launch configurations."""
     package_name = project_name.replace("-", "_").replace(" ", "_").lower()
@@ -271,7 +280,7 @@ def _get_workspace_launch_configs(
 
     # Add project-specific debug configurations
     if project_type == "web":
-        backend = _extract_tech_choice(tech_stack, "Backend Framework")
+        backend = choices.get("Backend Framework", "")
         if backend == "Django":
             configurations.append(
                 {
@@ -342,3 +351,18 @@ def _extract_tech_choice(tech_stack: dict[str, Any], category_name: str) -> str:
                     if option.get("recommended", False):
                         return str(option["name"])
     return ""
+
+
+def _tech_choice_index(tech_stack: dict[str, Any]) -> dict[str, str]:
+    """Map each category name to its recommended technology in a single pass."""
+    index: dict[str, str] = {}
+    if isinstance(tech_stack, dict) and "categories" in tech_stack:
+        for category in tech_stack["categories"]:
+            name = category.get("name")
+            if name in index:
+                continue
+            for option in category.get("options", []):
+                if option.get("recommended", False):
+                    index[name] = str(option["name"])
+                    break
+    return index
@@ -2,13 +2,28 @@
 Tests for the core_project_builder module.
 """
 
+import json
 import os
+import subprocess
+import sys
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
 from create_python_project.utils.core_project_builder import (
+    _create_package_json,
+    _create_scripts_directory,
+    _dumps_json,
+    _ensure_dirs,
+    _extract_tech_choice,
+    _flatten_recommended,
+    _install_packages,
+    _requirements_up_to_date,
+    _tech_choice_index,
+    _write_files,
     create_project_structure,
+    get_installation_commands_from_tech_stack,
     initialize_git_repo,
     setup_virtual_environment,
 )
@@ -95,6 +110,22 @@ class TestInitializeGitRepo:
             os.path.join(project_dir, ".github/CODEOWNERS")
         ), "CODEOWNERS file not created"
 
+    def test_initialize_git_repo_undecodable_stderr(self, temp_dir: str) -> None:
+        """Test that non-UTF-8 git output is reported instead of raising."""
+        # Setup
+        error = subprocess.CalledProcessError(128, "git init", stderr=b"fatal: \xff")
+
+        # Execute
+        with patch("subprocess.run", side_effect=error):
+            success, message = initialize_git_repo(
+                project_dir=temp_dir,
+                project_name="test_project",
+            )
+
+        # Assert
+        assert not success
+        assert message == "Failed to initialize Git repository: fatal: \ufffd"
+
 
 class TestCreateProjectStructure:
     """Tests for the create_project_structure function."""
@@ -187,6 +218,68 @@ class TestCreateProjectStructure:
                 "flask" in content.lower()
             ), "Flask dependency not found in pyproject.toml"
 
+    def test_create_project_without_initial_commit(self, temp_dir: str) -> None:
+        """Test that the initial commit can be deferred to the caller."""
+        # Setup
+        project_name = "test_project"
+        project_dir = os.path.join(temp_dir, project_name)
+
+        # Execute
+        success, message = create_project_structure(
+            project_name=project_name,
+            project_dir=project_dir,
+            project_type="basic",
+            initial_commit=False,
+        )
+
+        # Assert
+        assert success, f"Project creation failed: {message}"
+        assert os.path.isdir(os.path.join(project_dir, ".git")), "git not initialized"
+        head = subprocess.run(
+            ["git", "-C", project_dir, "rev-parse", "--verify", "-q", "HEAD"],
+            capture_output=True,
+        )
+        assert head.returncode != 0, "Initial commit was created"
+
+    def test_malformed_tech_stack_reports_failure(self, temp_dir: str) -> None:
+        """Test that a malformed tech stack is reported instead of raised."""
+        # Setup
+        project_dir = os.path.join(temp_dir, "test_project")
+        tech_stack = {"categories": [{"options": [{"recommended": True}]}]}
+
+        # Execute
+        success, message = create_project_structure(
+            project_name="test_project",
+            project_dir=project_dir,
+            project_type="basic",
+            tech_stack=tech_stack,
+        )
+
+        # Assert
+        assert not success
+        assert message.startswith("Failed to create project structure")
+
+    def test_generated_conftest_runs(self, temp_dir: str) -> None:
+        """Test that the generated tests/conftest.py executes cleanly."""
+        # Setup
+        project_dir = os.path.join(temp_dir, "test_project")
+        create_project_structure(
+            project_name="test_project",
+            project_dir=project_dir,
+            project_type="basic",
+            initial_commit=False,
+        )
+
+        # Execute
+        result = subprocess.run(
+            [sys.executable, os.path.join(project_dir, "tests", "conftest.py")],
+            capture_output=True,
+            text=True,
+        )
+
+        # Assert
+        assert result.returncode == 0, result.stderr
+
 
 class TestSetupVirtualEnvironment:
     """Tests for the setup_virtual_environment function."""
@@ -204,3 +297,285 @@ class TestSetupVirtualEnvironment:
         assert os.path.exists(
             os.path.join(project_dir, ".venv")
         ), ".venv directory not created"
+
+
+class TestInstallPackages:
+    """Tests for the _install_packages helper."""
+
+    def test_single_batched_call(self, temp_dir: str) -> None:
+        """Test that all packages are installed by one installer run."""
+        # Setup
+        ok = subprocess.CompletedProcess([], 0)
+
+        # Execute
+        with patch("subprocess.run", return_value=ok) as run:
+            installed = _install_packages(
+                ["poetry", "add"], ["flask", "redis"], temp_dir, "Python"
+            )
+
+        # Assert
+        assert installed
+        run.assert_called_once()
+        assert run.call_args.args[0] == ["poetry", "add", "flask", "redis"]
+
+    def test_falls_back_per_package(
+        self, temp_dir: str, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that a failed batch is retried one package at a time."""
+
+        # Setup
+        def fake_run(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess:
+            return subprocess.CompletedProcess(cmd, 1 if "bad-pkg" in cmd else 0)
+
+        # Execute
+        with patch("subprocess.run", side_effect=fake_run) as run:
+            installed = _install_packages(
+                ["npm", "install"], ["react", "bad-pkg"], temp_dir, "Node.js"
+            )
+
+        # Assert
+        assert not installed
+        assert [call.args[0] for call in run.call_args_list] == [
+            ["npm", "install", "react", "bad-pkg"],
+            ["npm", "install", "react"],
+            ["npm", "install", "bad-pkg"],
+        ]
+        assert "Failed to install Node.js package: bad-pkg" in capsys.readouterr().out
+
+
+class TestDumpsJson:
+    """Tests for the _dumps_json helper."""
+
+    def test_fallback_writes_utf8(self) -> None:
+        """Test that the json fallback writes non-ASCII text as UTF-8 like orjson."""
+        # Setup
+        data = {"name": "Café 🚀", "items": [1, {}], "empty": []}
+        expected = (
+            '{\n  "name": "Café 🚀",\n  "items": [\n    1,\n    {}\n  ],\n'
+            '  "empty": []\n}'
+        )
+
+        # Execute
+        with patch("create_python_project.utils.core_project_builder.orjson", None):
+            serialized = _dumps_json(data)
+
+        # Assert
+        assert serialized == expected.encode()
+        assert json.loads(serialized) == data
+
+
+class TestEnsureDirs:
+    """Tests for the _ensure_dirs helper."""
+
+    def test_creates_nested_and_existing_dirs(self, temp_dir: str) -> None:
+        """Test creating nested directories alongside ones that already exist."""
+        # Setup
+        os.makedirs(os.path.join(temp_dir, "docs"))
+        dirs = [
+            os.path.join(temp_dir, "tests", "unit"),
+            os.path.join(temp_dir, "tests"),
+            os.path.join(temp_dir, "docs"),
+            os.path.join(temp_dir, "src", "pkg"),
+        ]
+
+        # Execute
+        _ensure_dirs(dirs)
+
+        # Assert
+        for directory in dirs:
+            assert os.path.isdir(directory), f"{directory} not created"
+
+    def test_raises_when_path_is_a_file(self, temp_dir: str) -> None:
+        """Test that a file blocking a directory path is reported."""
+        # Setup
+        blocked = os.path.join(temp_dir, "docs")
+        with open(blocked, "w", encoding="utf-8") as f:
+            f.write("not a directory")
+
+        # Execute / Assert
+        with pytest.raises(FileExistsError):
+            _ensure_dirs([blocked])
+
+
+class TestWriteFiles:
+    """Tests for the _write_files helper."""
+
+    def test_writes_bytes_and_copies_templates(self, temp_dir: str) -> None:
+        """Test that rendered files and template copies land in one batch."""
+        # Setup
+        rendered = os.path.join(temp_dir, "rendered.txt")
+        gitignore = os.path.join(temp_dir, ".gitignore")
+
+        # Execute
+        _write_files([(rendered, b"hello\n")], [("scaffold/gitignore", gitignore)])
+
+        # Assert
+        with open(rendered, "rb") as f:
+            assert f.read() == b"hello\n"
+        with open(gitignore, encoding="utf-8") as f:
+            assert "__pycache__/" in f.read()
+
+    def test_missing_template_raises(self, temp_dir: str) -> None:
+        """Test that a failed copy is re-raised to the caller."""
+        # Execute / Assert
+        with pytest.raises(FileNotFoundError):
+            _write_files([], [("scaffold/missing", os.path.join(temp_dir, "x"))])
+
+
+class TestCreateScriptsDirectory:
+    """Tests for the _create_scripts_directory function."""
+
+    def test_scripts_reference_package(self, temp_dir: str) -> None:
+        """Test that generated scripts import the real package name."""
+        # Execute
+        _create_scripts_directory(temp_dir, "my_package")
+
+        # Assert
+        clean_run = os.path.join(temp_dir, "scripts", "clean_run.py")
+        with open(clean_run, encoding="utf-8") as f:
+            assert "from my_package import main" in f.read()
+        assert os.access(clean_run, os.X_OK), "clean_run.py is not executable"
+
+    def test_generated_scripts_run(self, temp_dir: str) -> None:
+        """Test that the generated scripts execute without missing imports."""
+        # Setup
+        _create_scripts_directory(temp_dir, "my_package")
+        package_dir = os.path.join(temp_dir, "src", "my_package")
+        os.makedirs(package_dir)
+        with open(os.path.join(package_dir, "__init__.py"), "w") as f:
+            f.write("def main():\n    print('main called')\n")
+        scripts_dir = os.path.join(temp_dir, "scripts")
+
+        # Execute
+        clean_run = subprocess.run(
+            [sys.executable, os.path.join(scripts_dir, "clean_run.py")],
+            cwd=temp_dir,
+            capture_output=True,
+            text=True,
+        )
+        # Outside a git repository the workflow stops at its first Path check
+        commit_workflow = subprocess.run(
+            [sys.executable, os.path.join(scripts_dir, "commit_workflow.py")],
+            cwd=temp_dir,
+            capture_output=True,
+            text=True,
+        )
+
+        # Assert
+        assert clean_run.returncode == 0, clean_run.stderr
+        assert "main called" in clean_run.stdout
+        assert commit_workflow.returncode == 1, commit_workflow.stderr
+        assert "Not in a git repository" in commit_workflow.stdout
+
+
+class TestCreatePackageJson:
+    """Tests for the _create_package_json function."""
+
+    def test_mcp_servers_follow_recommendations(
+        self, temp_dir: str, mock_tech_stack: dict[str, Any]
+    ) -> None:
+        """Test that MCP servers are added only for recommended technologies."""
+        # Setup
+        mock_tech_stack["categories"][0]["options"].append(
+            {"name": "WebSockets", "recommended": False}
+        )
+
+        # Execute
+        _create_package_json(temp_dir, mock_tech_stack)
+
+        # Assert
+        with open(os.path.join(temp_dir, "package.json"), encoding="utf-8") as f:
+            dependencies = json.load(f)["dependencies"]
+        assert "@modelcontextprotocol/server-postgres" in dependencies
+        assert "websocket-debugger-mcp" not in dependencies
+
+
+class TestTechChoiceIndex:
+    """Tests for the _tech_choice_index function."""
+
+    def test_matches_extract_tech_choice(self, mock_tech_stack: dict[str, Any]) -> None:
+        """Test that index lookups agree with _extract_tech_choice."""
+        # Setup
+        mock_tech_stack["categories"].append(
+            {"name": "Frontend", "options": [{"name": "React", "recommended": False}]}
+        )
+
+        # Execute
+        index = _tech_choice_index(mock_tech_stack)
+
+        # Assert
+        assert index == {"Backend Framework": "Flask", "Database": "PostgreSQL"}
+        for category in ("Backend Framework", "Database", "Frontend", "Missing"):
+            assert index.get(category, "") == _extract_tech_choice(
+                mock_tech_stack, category
+            )
+
+
+class TestFlattenRecommended:
+    """Tests for the _flatten_recommended function."""
+
+    def test_lists_recommended_options_in_order(
+        self, mock_tech_stack: dict[str, Any]
+    ) -> None:
+        """Test that only recommended options are listed, in stack order."""
+        # Execute
+        recommended = _flatten_recommended(mock_tech_stack)
+
+        # Assert
+        assert recommended == [
+            ("Backend Framework", "Flask"),
+            ("Database", "PostgreSQL"),
+        ]
+        assert _tech_choice_index(mock_tech_stack, recommended) == (
+            _tech_choice_index(mock_tech_stack)
+        )
+
+    def test_non_dict_tech_stack(self) -> None:
+        """Test that a malformed tech stack yields no recommendations."""
+        # Execute / Assert
+        assert _flatten_recommended([]) == []
+
+
+class TestGetInstallationCommands:
+    """Tests for the get_installation_commands_from_tech_stack function."""
+
+    def test_commands_from_packaged_table(
+        self, mock_tech_stack: dict[str, Any]
+    ) -> None:
+        """Test that recommended technologies map to their install packages."""
+        # Execute
+        commands = get_installation_commands_from_tech_stack(mock_tech_stack)
+
+        # Assert
+        assert commands["python"] == [
+            "flask",
+            "python-dotenv",
+            "flask-cors",
+            "psycopg2-binary",
+            "sqlalchemy",
+        ]
+        assert commands["node"] == []
+
+
+class TestRequirementsUpToDate:
+    """Tests for the _requirements_up_to_date helper."""
+
+    def test_export_freshness(self, temp_dir: str) -> None:
+        """Test that only a requirements.txt newer than its inputs is current."""
+        # Setup
+        for name, mtime in (
+            ("pyproject.toml", 100),
+            ("poetry.lock", 200),
+            ("requirements.txt", 300),
+        ):
+            path = os.path.join(temp_dir, name)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("")
+            os.utime(path, (mtime, mtime))
+
+        # Execute / Assert
+        assert _requirements_up_to_date(temp_dir)
+        os.utime(os.path.join(temp_dir, "poetry.lock"), (400, 400))
+        assert not _requirements_up_to_date(temp_dir)
+        os.remove(os.path.join(temp_dir, "requirements.txt"))
+        assert not _requirements_up_to_date(temp_dir)
@@ -292,3 +292,27 @@ class TestExtractTechChoice:
 
         # Assert
         assert result == ""
+
+
+class TestTechChoiceIndex:
+    """Test the _tech_choice_index function."""
+
+    def test_tech_choice_index_matches_extract(self, mock_tech_stack):
+        """Test that the index agrees with per-category extraction."""
+        # Act
+        index = workspace_config._tech_choice_index(mock_tech_stack)
+
+        # Assert
+        for category in mock_tech_stack["categories"]:
+            name = category["name"]
+            assert index.get(name, "") == workspace_config._extract_tech_choice(
+                mock_tech_stack, name
+            )
+
+    def test_tech_choice_index_empty_stack(self):
+        """Test indexing an empty tech stack."""
+        # Act
+        index = workspace_config._tech_choice_index({})
+
+        # Assert
+        assert index == {}